@@ -52,6 +52,8 @@ class BoardCell(object):
     __str__
     """
 
+    __slots__ = ('location', 'contents', 'empty')
+
     def __init__(self, location, piece = None, empty = ' '):
         """
         Initialize the cell. (None)
@@ -87,6 +89,9 @@ class BoardCell(object):
     def __hash__(self):
         """
         Hash function on the cell. (int)
+
+        This is needed for keeping cells in sets, since defining __eq__ removes
+        the default hash.
         """
         return hash(self.location)
 
@@ -202,6 +207,8 @@ class MultiCell(BoardCell):
     __str__
     """
 
+    __slots__ = ()
+
     def __init__(self, location, pieces = None, empty = ' '):
         """
         Initialize the cell. (None)
@@ -261,9 +268,9 @@ class MultiCell(BoardCell):
 
     def add_piece(self, piece):
         """
-        Add a piece to the cell. (object)
+        Add a piece to the cell. (None)
 
-        The return value is the piece that was in the cell before.
+        Pieces are stacked in the cell, so nothing is captured.
 
         Parameters:
         piece: The piece to add to the cell. (object)
@@ -328,7 +335,10 @@ class Coordinate(tuple):
         """
         Absolute value (Cooordinate)
         """
-        return Coordinate([abs(a) for a in self])
+        if len(self) == 2:
+            return Coordinate((abs(self[0]), abs(self[1])))
+        else:
+            return Coordinate([abs(a) for a in self])
 
     def __add__(self, other):
         """
@@ -339,11 +349,14 @@ class Coordinate(tuple):
         Parameters:
         other: The coordinate to add to (list, tuple, or Coordinate)
         """
-        if isinstance(other, (Coordinate, tuple, list)):
-            if len(self) == len(other):
-                return Coordinate([a + b for a, b in zip(self, other)])
-            else:
+        if isinstance(other, (tuple, list)):
+            if len(self) != len(other):
                 raise ValueError('Coordinates can only add in the same dimension.')
+            # Fast path for the common two dimensional case.
+            elif len(self) == 2:
+                return Coordinate((self[0] + other[0], self[1] + other[1]))
+            else:
+                return Coordinate([a + b for a, b in zip(self, other)])
         else:
             return NotImplemented
 
@@ -354,13 +367,19 @@ class Coordinate(tuple):
         Parameters:
         other: The scale to multiply by. (int or float)
         """
-        return Coordinate([a * other for a in self])
+        if len(self) == 2:
+            return Coordinate((self[0] * other, self[1] * other))
+        else:
+            return Coordinate([a * other for a in self])
 
     def __neg__(self):
         """
         Negation (Coordinate)
         """
-        return Coordinate([-a for a in self])
+        if len(self) == 2:
+            return Coordinate((-self[0], -self[1]))
+        else:
+            return Coordinate([-a for a in self])
 
     def __radd__(self, other):
         """
@@ -398,11 +417,14 @@ class Coordinate(tuple):
         Parameters:
         other: The coordinate to subtract. (list, tuple, or Coordinate)
         """
-        if isinstance(other, (Coordinate, tuple, list)):
-            if len(self) == len(other):
-                return Coordinate([a - b for a, b in zip(self, other)])
-            else:
+        if isinstance(other, (tuple, list)):
+            if len(self) != len(other):
                 raise ValueError('Coordinates can only add in the same dimension.')
+            # Fast path for the common two dimensional case.
+            elif len(self) == 2:
+                return Coordinate((self[0] - other[0], self[1] - other[1]))
+            else:
+                return Coordinate([a - b for a, b in zip(self, other)])
         else:
             return NotImplemented
 
@@ -412,6 +434,7 @@ class Board(object):
     A playing board for a game. (object)
 
     Attributes:
+    cell_list: The cells in the order they were created. (list of BoardCell)
     cells: The locations that make up the board. (dict of Coordinate: BoardCell)
     extra_cells: A list of non-standard locations. (list of BoardCell)
 
@@ -439,7 +462,8 @@ class Board(object):
         locations: The locations of the cells on the board. (list of hashable)
         cell_class: The class for the cells on the board. (class)
         """
-        self.cells = {location: cell_class(location) for location in locations}
+        self.cell_list = [cell_class(location) for location in locations]
+        self.cells = {cell.location: cell for cell in self.cell_list}
         self.extra_cells = []
 
     def __iter__(self):
@@ -458,18 +482,26 @@ class Board(object):
 
     def clear(self):
         """Clear all pieces off the board. (None)"""
-        for cell in self.cells.values():
+        for cell in self.cell_list:
             cell.clear()
 
     def copy_pieces(self, parent):
         """
         Copy all of the pieces from another board. (None)
 
+        The other board must have the same cells, created in the same order.
+
         Parameters:
         parent: The board to copy pieces from. (Board)
         """
-        for location in parent.cells:
-            self.cells[location].contents = parent.cells[location].copy_piece()
+        pairs = zip(self.cell_list, parent.cell_list)
+        if parent.cell_list and type(parent.cell_list[0]).copy_piece == BoardCell.copy_piece:
+            # Pieces that don't need copying can be shared directly.
+            for cell, parent_cell in pairs:
+                cell.contents = parent_cell.contents
+        else:
+            for cell, parent_cell in pairs:
+                cell.contents = parent_cell.copy_piece()
 
     def displace(self, start, end, piece = None):
         """
@@ -534,7 +566,8 @@ class Board(object):
         piece: The piece that would move to that spot. (object)
         """
         cell = self.cells[location]
-        return piece not in cell and len(cell) > 1 and location not in self.extra_cells
+        # Check the length first, since most cells have fewer than two pieces.
+        return len(cell) > 1 and piece not in cell and location not in self.extra_cells
 
     def safe_displace(self, start, end, piece = None):
         """
@@ -545,22 +578,23 @@ class Board(object):
         end: The location to move the piece to. (Coordinate)
         piece: The piece to move. (object)
         """
+        start_cell, end_cell = self.cells[start], self.cells[end]
         # Check for a safe move.
-        mover = self.cells[start].remove_piece(piece)
+        mover = start_cell.remove_piece(piece)
         if self.safe(end, mover):
-            self.cells[start].add_piece(mover)
+            start_cell.add_piece(mover)
             raise ValueError('Attempt to capture safe cell {!r}.'.format(end))
         # Check the desitnation for capture situations.
-        end_pieces = self.cells[end].contents
+        end_pieces = end_cell.contents
         if mover in end_pieces or not end_pieces or end in self.extra_cells:
             # Do a simple move to an empty destination.
-            self.cells[end].add_piece(mover)
+            end_cell.add_piece(mover)
             return []
         else:
             # Move to a occupied location and return the occupants as the capture.
-            capture = self.cells[end].get_piece()
-            self.cells[end].clear()
-            self.cells[end].add_piece(mover)
+            capture = end_cell.get_piece()
+            end_cell.clear()
+            end_cell.add_piece(mover)
             return capture
 
 
@@ -571,6 +605,11 @@ class DimBoard(Board):
     Attributes:
     cell_class: The class defining the individual cells. (type)
     dimensions: The dimensions of the board, in cells. (tuple of int)
+    offsets: Known results of offsets from locations. (dict of tuple: Coordinate)
+
+    Class Attributes:
+    location_cache: The locations for each set of dimensions. (dict of tuple: list)
+    offset_cache: The offsets for each set of dimensions. (dict of tuple: dict)
 
     Methods:
     copy: Create a copy of the board. (DimBoard)
@@ -578,8 +617,12 @@ class DimBoard(Board):
     Overridden Methods:
     __init__
     __repr__
+    offset
     """
 
+    location_cache = {}
+    offset_cache = {}
+
     def __init__(self, dimensions, cell_class = BoardCell):
         """
         Set up the grid of cells. (None)
@@ -591,11 +634,14 @@ class DimBoard(Board):
         # Store the definition.
         self.dimensions = dimensions
         self.cell_class = cell_class
-        # Calculate the locations.
-        locations = itertools.product(*[range(1, dimension + 1) for dimension in self.dimensions])
-        locations = [Coordinate(location) for location in locations]
+        # Calculate the locations (once for each size, since copies are frequent).
+        key = tuple(dimensions)
+        if key not in self.location_cache:
+            locations = itertools.product(*[range(1, dimension + 1) for dimension in self.dimensions])
+            self.location_cache[key] = [Coordinate(location) for location in locations]
+        self.offsets = self.offset_cache.setdefault(key, {})
         # Set up the cells.
-        super(DimBoard, self).__init__(locations, cell_class)
+        super(DimBoard, self).__init__(self.location_cache[key], cell_class)
 
     def __repr__(self):
         """Create a debugging text representation. (str)"""
@@ -609,6 +655,26 @@ class DimBoard(Board):
         clone.copy_pieces(self)
         return clone
 
+    def offset(self, cell, offset):
+        """
+        Return a cell offset from another cell (BoardCell)
+
+        The resulting locations are stored, and shared by all boards of the same
+        dimensions, so each offset is only calculated once.
+
+        Parameters:
+        cell: The location of the starting cell. (Coordinate)
+        offset: The relative location of the target cell. (Coordinate)
+        """
+        try:
+            return self.cells[self.offsets[cell, offset]]
+        except KeyError:
+            # Calculate new offsets (off board offsets raise KeyError and are not stored).
+            target = self.cells[cell + offset]
+            # Store the cell's own location, so no new Coordinates are kept.
+            self.offsets[cell, offset] = target.location
+            return target
+
 
 class LineBoard(Board):
     """
@@ -627,7 +693,7 @@ class LineBoard(Board):
     __init__
     """
 
-    def __init__(self, length, cell_class = MultiCell, extra_cells = []):
+    def __init__(self, length, cell_class = MultiCell, extra_cells = None):
         """
         Set up the line of cells. (None)
 
@@ -641,9 +707,11 @@ class LineBoard(Board):
         self.cell_class = cell_class
         super(LineBoard, self).__init__(range(1, length + 1), cell_class)
         # Set up any extra cells.
-        self.extra_cells = extra_cells
+        if extra_cells is not None:
+            self.extra_cells = extra_cells
         for location in self.extra_cells:
             self.cells[location] = cell_class(location)
+            self.cell_list.append(self.cells[location])
 
     def copy(self, **kwargs):
         """Create a copy of the board. (LineBoard)"""
@@ -672,15 +740,12 @@ class MultiBoard(DimBoard):
         Paramters:
         dimensions: The dimensions of the board, in cells. (tuple of int)
         """
-        super(MultiBoard, self).__init__(dimensions, list)
+        super(MultiBoard, self).__init__(dimensions, MultiCell)
 
     def copy(self, **kwargs):
         """Create a copy of the board. (MultiBoard)"""
-        # clone the cells
         clone = self.__class__(self.dimensions, **kwargs)
-        # clone the cell contents
-        for location in clone:
-            clone.cells[location].piece = self.cells[location].piece[:]
+        clone.copy_pieces(self)
         return clone
 
     def move(self, start, end):
@@ -695,14 +760,14 @@ class MultiBoard(DimBoard):
         end: The location to move the piece to. (Coordinate)
         """
         # store the captured piece
-        capture = self.cells[end].piece[:]
+        capture = self.cells[end].copy_piece()
         # move the piece
-        mover = self.cells[start].piece.pop()
-        if not (capture == self.default_piece() or mover == capture[0]):
-            self.cells[end].piece = self.default_piece()
+        mover = self.cells[start].contents.pop()
+        if not (capture == [] or mover == capture[0]):
+            self.cells[end].clear()
         else:
-            capture = self.default_piece()
-        self.cells[end].piece.append(mover)
+            capture = []
+        self.cells[end].contents.append(mover)
         return capture
 
     def place(self, piece, cell):
@@ -715,7 +780,7 @@ class MultiBoard(DimBoard):
         piece: The piece to place on the board. (See BoardCell)
         cell: The location to place the piece in. (Coordinate)
         """
-        self.cells[cell].piece.append(piece)
+        self.cells[cell].contents.append(piece)
 
 
 if __name__ == '__main__':
@@ -111,6 +111,7 @@ class Chess(game.Game):
     history: A list of board strings for previous moves. (list of str)
     opening: The FEN notation for opening to play. (str)
     skip_white: A flag for the game starting with the black player. (bool)
+    text_cache: Board text already generated for a position. (dict of tuple: str)
     unicode: A flag for displaying the board with unicode pieces. (bool)
     white: A flag for the huamn playing the white pieces. (bool)
 
@@ -119,6 +120,7 @@ class Chess(game.Game):
     move_re: A regular expression for an algebraic move. (re.SRE_Pattern)
     openings: FEN strings for vailable starting positions. (dict of str: str)
     unicode_pieces: Translation of ascii to unicode for pieces. (dict of str: str)
+    unicode_table: The unicode_pieces translation table for str.translate. (dict)
 
     Methods:
     board_text: Get the text for a given position. (str)
@@ -157,6 +159,7 @@ class Chess(game.Game):
         'mate-test': '8/5K1k/8/6Q1/8/8/8/8|w|-|-|0|81'}
     unicode_pieces = {'R':'♜', 'N':'♞', 'B':'♝', 'Q':'♛', 'K':'♚', 'P':'♟',
         'r':'♖', 'n':'♘', 'b':'♗', 'q':'♕', 'k':'♔', 'p':'♙', '.':'·'}
+    unicode_table = dict((ord(piece), symbol) for piece, symbol in unicode_pieces.items())
 
     def __str__(self):
         """Human readable text representation. (str)"""
@@ -170,11 +173,21 @@ class Chess(game.Game):
         position: The position to get the text for. (sunfish.Position)
         black: A flag indicating the position is for the black player. (bool)
         """
+        # Check for previously generated text.
+        key = (position.board, black, self.unicode)
+        if key in self.text_cache:
+            return self.text_cache[key]
         # Get the lines of text for the board.
         lines = ['']
-        for row_index, row in enumerate(position.board.split(), start = 1):
+        for row_index, row_start in enumerate(range(21, 92, 10), start = 1):
+            # Slice the eight squares out of the ten characters for each row.
+            row = position.board[row_start:(row_start + 8)]
             if self.unicode:
-                row = [self.unicode_pieces.get(piece, piece) for piece in row]
+                try:
+                    row = row.translate(self.unicode_table)
+                except TypeError:
+                    # Python 2.7 byte strings can't translate to multi-byte characters.
+                    row = [self.unicode_pieces.get(piece, piece) for piece in row]
             if not black:
                 row_index = 9 - row_index
             lines.append(' {} {}'.format(row_index, ' '.join(row)))
@@ -188,6 +201,7 @@ class Chess(game.Game):
         # Reverse piece 'colors' for black.
         if black:
             text = text.swapcase()
+        self.text_cache[key] = text
         return text
 
     def default(self, text):
@@ -197,9 +211,11 @@ class Chess(game.Game):
         Parameters:
         text: The raw text input by the user. (str)
         """
-        # Treat chess notation as a move.
-        if self.move_re.match(text) or self.castle_re.match(text.lower()) or text.isdigit():
-            return self.do_move(text)
+        # Treat chess notation as a move (passing on any match to avoid redoing it).
+        move_text = text.strip()
+        match = self.move_re.match(move_text)
+        if match or self.castle_re.match(move_text.lower()) or move_text.isdigit():
+            return self.do_move(move_text, match)
         else:
             return super(Chess, self).default(text)
 
@@ -284,7 +300,7 @@ class Chess(game.Game):
             self.human.tell(text)
         return go
 
-    def do_move(self, arguments):
+    def do_move(self, arguments, match = None):
         """
         Make a move in the game.
 
@@ -295,7 +311,7 @@ class Chess(game.Game):
         """
         # Get the player and the move.
         player = self.players[self.player_index]
-        sun_move = self.parse_move(arguments)
+        sun_move = self.parse_move(arguments, match)
         # Check for an error parsing the move.
         if sun_move[0] is None:
             player.error(sun_move[1])
@@ -311,15 +327,16 @@ class Chess(game.Game):
                     self.draw_turns += 1
                 else:
                     self.draw_turns = 0
-                # Make the move.
+                # Make the move (rotating once for both the history and the display).
                 self.position = self.position.move(sun_move)
+                rotated = self.position.rotate()
                 # Store the move for checking three fold repetition.
                 if self.player_index:
                     self.history.append(self.position.board)
                 else:
-                    self.history.append(self.position.rotate().board)
+                    self.history.append(rotated.board)
                 # Show the player the resulting position from their perspective.
-                player.tell(self.board_text(self.position.rotate(), self.player_index))
+                player.tell(self.board_text(rotated, self.player_index))
                 return False
             else:
                 # Warn about moves that are not legal.
@@ -385,7 +402,8 @@ class Chess(game.Game):
         """
         # Determine what information was provided.
         groups = match.groups()
-        match_type = sum(2 ** index for index, group in enumerate(groups) if group is not None)
+        match_type = (groups[0] is not None) | (groups[1] is not None) << 1
+        match_type |= (groups[2] is not None) << 2 | (groups[3] is not None) << 3
         # Handle single squares (pawn moves).
         if match_type in (8, 10):
             end = sunfish.parse(groups[3])
@@ -484,21 +502,22 @@ class Chess(game.Game):
         self.turns = int(moves) * 2
         return position
 
-    def parse_move(self, text):
+    def parse_move(self, text, match = None):
         """
         Parse a move into one Sunfish recognizes. (tuple)
 
         Parameters:
         text: The text version of the move provided by the user. (str)
+        match: The algebraic move match, if already made. (re.SRE_Match or None)
         """
         text = text.strip() # ?? unneccesary?
-        match = self.move_re.match(text)
-        castle = self.castle_re.match(text)
+        if match is None:
+            match = self.move_re.match(text)
         # Check for algebraic moves.
         if match:
             return self.parse_algebraic(text, match)
         # Check for castling moves.
-        elif castle:
+        elif self.castle_re.match(text.lower()):
             if self.player_index:
                 start = 29 - self.position.board.index('k') % 10
             else:
@@ -557,6 +576,7 @@ class Chess(game.Game):
         # Set the tracking variables.
         self.skip_white = False
         self.draw_turns = 0
+        self.text_cache = {}
         # Set up the position
         if self.opening:
             self.position = self.parse_fen(self.opening)
@@ -574,6 +594,12 @@ class SunfishBot(player.Bot):
     """
     A bot for making Sunfish moves. (player.Bot)
 
+    The searcher is created once per game, so its transposition tables carry
+    over from one move to the next.
+
+    Attributes:
+    searcher: The Sunfish search engine. (sunfish.Searcher)
+
     Overridden Methods:
     ask
     set_up
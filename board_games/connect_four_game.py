@@ -310,7 +310,7 @@ class C4Board(board.DimBoard):
     get_moves
     """
 
-    def __init__(self, dimensions = (7, 6), pieces = [], wins = [], poppable = False):
+    def __init__(self, dimensions = (7, 6), pieces = [], wins = None, poppable = False):
         """
         Set up the board and the winning positions. (None)
 
@@ -330,6 +330,7 @@ class C4Board(board.DimBoard):
         # set up winning positions
         self.wins = wins
         if not self.wins:
+            self.wins = []
             # Loop through all the spaces.
             for col in range(1, dimensions[0] + 1):
                 for row in range(1, dimensions[1] + 1):
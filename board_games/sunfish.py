@@ -4,6 +4,7 @@
 from __future__ import print_function
 import re, sys, time
 from itertools import count
+from operator import itemgetter
 from collections import OrderedDict, namedtuple
 
 ###############################################################################
@@ -109,7 +110,7 @@ MATE_LOWER = piece['K'] - 10*piece['Q']
 MATE_UPPER = piece['K'] + 10*piece['Q']
 
 # The table size is the maximum number of elements in the transposition table.
-TABLE_SIZE = 1e8
+TABLE_SIZE = 10 ** 8
 
 # Constants for tuning search
 QS_LIMIT = 150
@@ -134,24 +135,27 @@ class Position(namedtuple('Position', 'board score wc bc ep kp')):
         # For each of our pieces, iterate through each possible 'ray' of moves,
         # as defined in the 'directions' map. The rays are broken e.g. by
         # captures or immediately in case of pieces such as knights.
-        for i, p in enumerate(self.board):
-            if not p.isupper(): continue
-            for d in directions[p]:
+        # The board and the piece/direction map are bound locally, and only our
+        # own pieces (the keys of directions) are expanded.
+        board, moves_of = self.board, directions
+        for i, p in enumerate(board):
+            if p not in moves_of: continue
+            for d in moves_of[p]:
                 for j in count(i+d, d):
-                    q = self.board[j]
+                    q = board[j]
                     # Stay inside the board, and off friendly pieces
                     if q.isspace() or q.isupper(): break
                     # Pawn move, double move and capture
                     if p == 'P' and d in (N, N+N) and q != '.': break
-                    if p == 'P' and d == N+N and (i < A1+N or self.board[i+N] != '.'): break
+                    if p == 'P' and d == N+N and (i < A1+N or board[i+N] != '.'): break
                     if p == 'P' and d in (N+W, N+E) and q == '.' and j not in (self.ep, self.kp): break
                     # Move it
                     yield (i, j)
                     # Stop crawlers from sliding, and sliding after captures
                     if p in 'PNK' or q.islower(): break
                     # Castling, by sliding the rook next to the king
-                    if i == A1 and self.board[j+E] == 'K' and self.wc[0]: yield (j+E, j+W)
-                    if i == H1 and self.board[j+W] == 'K' and self.wc[1]: yield (j+W, j+E)
+                    if i == A1 and board[j+E] == 'K' and self.wc[0]: yield (j+E, j+W)
+                    if i == H1 and board[j+W] == 'K' and self.wc[1]: yield (j+W, j+E)
 
     def rotate(self):
         ''' Rotates the board, preserving enpassant '''
@@ -297,10 +301,13 @@ class Searcher:
             killer = self.tp_move.get(pos)
             if killer and (depth > 0 or pos.value(killer) >= QS_LIMIT):
                 yield killer, -self.bound(pos.move(killer), 1-gamma, depth-1, root=False)
-            # Then all the other moves
-            for move in sorted(pos.gen_moves(), key=pos.value, reverse=True):
-                if depth > 0 or pos.value(move) >= QS_LIMIT:
-                    yield move, -self.bound(pos.move(move), 1-gamma, depth-1, root=False)
+            # Then all the other moves. Each move is valued once, for both the
+            # ordering and the QSearch cutoff. Since the moves are sorted by
+            # value, QSearch can stop at the first quiet move.
+            value = pos.value
+            for val, move in sorted([(value(m), m) for m in pos.gen_moves()], key=itemgetter(0), reverse=True):
+                if depth <= 0 and val < QS_LIMIT: break
+                yield move, -self.bound(pos.move(move), 1-gamma, depth-1, root=False)
 
         # Run through the moves, shortcutting when possible
         best = -MATE_UPPER
@@ -45,6 +45,7 @@ class Card(object):
     color: The color of the card. ('R' or 'B')
     name: The full name of the card. (str)
     rank: The rank of the card. (str)
+    rank_num: The numeric rank of the card. (int)
     suit: The suit of the card. (str)
     up: A flag for the card being face up. (str)
 
@@ -82,13 +83,14 @@ class Card(object):
         # Set the specified paramters.
         self.rank = rank[0]
         self.suit = suit[0]
+        self.rank_num = self.ranks.index(self.rank)
         # Calculated the color of the card.
         if self.suit in 'DH':
             self.color = 'R'
         else:
             self.color = 'B'
         # Calcuate the text attributes of the card.
-        rank_name = self.rank_names[self.ranks.index(self.rank)]
+        rank_name = self.rank_names[self.rank_num]
         suit_name = self.suit_names[self.suits.index(self.suit)]
         self.name = '{} of {}'.format(rank_name, suit_name)
         self.up_text = self.rank + self.suit
@@ -149,7 +151,7 @@ class Card(object):
     def __lt__(self, other):
         """For sorting by rank. (bool)"""
         if isinstance(other, Card):
-            return self.ranks.index(self.rank) < self.ranks.index(other.rank)
+            return self.rank_num < other.rank_num
         else:
             return self.rank < other  # ?? do I want this? from class where rank is int.
 
@@ -173,7 +175,7 @@ class Card(object):
         wrap_ranks: A flag for K-A-2 wrapping. (bool)
         """
         # Do the standard caculation
-        diff = self.ranks.index(self.rank) - self.ranks.index(other.rank)
+        diff = self.rank_num - other.rank_num
         # Account for wrap ranks.
         if wrap_ranks and diff < 0:
             diff += len(self.ranks) - 1
@@ -188,7 +190,7 @@ class Card(object):
         wrap_ranks: A flag for K-A-2 wrapping. (bool)
         """
         # Do the standard caculation
-        diff = self.ranks.index(other.rank) - self.ranks.index(self.rank)
+        diff = other.rank_num - self.rank_num
         # Account for wrap ranks.
         if wrap_ranks and diff < 0:
             diff += len(self.ranks) - 1
@@ -335,8 +337,7 @@ class Deck(object):
         card_text: The string version of the card. (str)
         up = Flag for dealing the card face up. (bool)
         """
-        card = self.cards[self.cards.index(card_text)]
-        self.cards.remove(card)
+        card = self.cards.pop(self.cards.index(card_text))
         card.up = up
         return card
 
@@ -367,7 +368,7 @@ class Deck(object):
         else:
             # Do a C-style shuffle.
             rand = CRand(number)
-            self.cards.sort(key = lambda card: (card.ranks.index(card.rank), card.suit))
+            self.cards.sort(key = lambda card: (card.rank_num, card.suit))
             while self.cards:
                 swap = rand() % len(self.cards)
                 self.cards[swap], self.cards[-1] = self.cards[-1], self.cards[swap]
@@ -474,7 +475,7 @@ class Hand(object):
     def score(self):
         """Score the hand. (int)"""
         # Default score is high card.
-        return max([Card.ranks.index(card.rank) for card in self.cards])
+        return max([card.rank_num for card in self.cards])
 
     def shift(self, card, hand):
         """
@@ -501,7 +502,6 @@ class TrackingCard(Card):
     game_location: The location of the card in the game. (list of Card)
     loc_txt: The location identifier for abbreviated card text. (str)
     location_text: The location identifier for full card text. (str)
-    rank_num: The numeric rank of the card. (int)
 
     Methods:
     discard: Discard the card. (None)
@@ -526,7 +526,6 @@ class TrackingCard(Card):
         """
         super(TrackingCard, self).__init__(rank, suit)
         self.deck = deck
-        self.rank_num = self.ranks.index(self.rank)
         if self.deck is not None:
             self.deck_location = self.deck.cards
             self.game_location = self.deck.cards
@@ -112,6 +112,7 @@ Remove: Remove a bet, using the number from the bets command.
 
 OPTIONS:
 american (a): Use the American layout (the default).
+fast (fs): Spin the wheel without pausing.
 french (f): Use the French layout.
 limit= (l=): The maximum bet for any single bet, defaults to 10.
 stake= (s=): How much money you start with, defaults to 100.
@@ -125,23 +126,38 @@ class Roulette(game.Game):
 
     Class Attributes:
     american: The order of the wheel in the American layout. (list of str)
-    black: The black numbers. (list of str)
+    black: The black numbers. (tuple of str)
+    columns: The numbers in each column of the layout. (list of tuple of str)
+    dozens: The numbers in each dozen. (list of tuple of str)
+    even_numbers: The even numbers. (tuple of str)
     french: The order of the wheel in the French layout. (list of str)
+    group_index: Column and dozen indexes by specifier. (dict of str: int)
+    high_numbers: The numbers over 18. (tuple of str)
     int_re: A regular expression to capture numbers. (re.SRE_Pattern)
-    red: The red numbers. (list of str)
+    low_numbers: The non-zero numbers 18 and under. (tuple of str)
+    odd_numbers: The odd numbers. (tuple of str)
+    red: The red numbers. (tuple of str)
+    snake_numbers: The zig-zag of red numbers from 1 to 34. (tuple of str)
 
     Attributes
     bets: Bets made this round. (list of tuple)
+    complete_bets: The one buck complete bets for each number. (dict of str: list)
+    fast: A flag for spinning the wheel without pausing. (bool)
+    finals: The non-zero numbers ending in each digit. (dict of str: list of str)
     forced_spin: The numbers the next spin must come from. (list of str)
     layout: American or French layout. (str)
     max_bet: The maximum allowed bet. (int)
+    neighborhoods: The wheel numbers around a number, by number and width. (dict)
     numbers: The numbers on the wheel. (list of str)
+    numbers_set: The numbers on the wheel, for checking bets. (frozenset of str)
+    splits: The pairs of numbers that can be split bets. (set of frozenset)
+    trios: The numbers that can be trio bets. (frozenset of str)
     stake: The starting money the player gets. (int)
     uk_rule: A flag for getting half back on losing 1:1 bets. (bool)
 
     Methods:
     check_bet: Do common checking for valid bets. (str, int)
-    check_two_numbers: Check for two numbers in the layout. (bool)
+    check_two_numbers: Check for two numbers in the layout. (tuple of int)
     complete_corners: Get all corner bets for a complete bet. (list of tuple)
     complete_splits: Get all split bets for a complete bet. (list of tuple)
     complete_streets: Get all street and double street bets for a complete bet. (list)
@@ -197,20 +213,28 @@ class Roulette(game.Game):
     american = ['0', '28', '9', '26', '30', '11', '7', '20', '32', '17', '5', '22', '34', '15', '3', '24',
         '36', '13', '1', '00', '27', '10', '25', '29', '12', '8', '19', '31', '18', '6', '21', '33', '16',
         '4', '23', '35', '14', '2']
-    black = ['2', '4', '6', '8', '10', '11', '13', '15', '17', '20', '22', '24', '26', '28', '29', '31',
-        '33', '35']
+    black = ('2', '4', '6', '8', '10', '11', '13', '15', '17', '20', '22', '24', '26', '28', '29', '31',
+        '33', '35')
     categories = ['Gambling Games']
+    columns = [tuple(str(number) for number in range(start, 37, 3)) for start in (1, 2, 3)]
     credits = CREDITS
+    dozens = [tuple(str(number) for number in range(start, start + 12)) for start in (1, 13, 25)]
+    even_numbers = tuple(str(number) for number in range(2, 37, 2))
     french = ['0', '32', '15', '19', '4', '21', '2', '25', '17', '34', '6', '27', '13', '36', '11', '30',
         '8', '23', '10', '5', '24', '16', '33', '1', '20', '14', '31', '9', '22', '18', '29', '7', '28',
         '12', '35', '3', '26']
+    group_index = {'1': 0, 'p': 0, 'f': 0, '2': 1, 'm': 1, 's': 1, '3': 2, 'd': 2, 't': 2}
     help_text = {'house-edge': HOUSE_HELP}
-    int_re = re.compile('\d+')
+    high_numbers = tuple(str(number) for number in range(19, 37))
+    int_re = re.compile('[0-9]+')
+    low_numbers = tuple(str(number) for number in range(1, 19))
     name = 'Roulette'
-    num_options = 4
-    red = ['1', '3', '5', '7', '9', '12', '14', '16', '18', '19', '21', '23', '25', '27', '30', '32', '34',
-        '36']
+    num_options = 5
+    odd_numbers = tuple(str(number) for number in range(1, 37, 2))
+    red = ('1', '3', '5', '7', '9', '12', '14', '16', '18', '19', '21', '23', '25', '27', '30', '32', '34',
+        '36')
     rules = RULES
+    snake_numbers = ('1', '5', '9', '12', '14', '16', '19', '23', '27', '30', '32', '34')
 
     def check_bet(self, arguments):
         """
@@ -247,7 +271,10 @@ class Roulette(game.Game):
 
     def check_two_numbers(self, pair, bet_type):
         """
-        Check for two numbers in the layout. (bool)
+        Check for two numbers in the layout. (tuple of int)
+
+        The two numbers are returned low number first, or an empty tuple is returned
+        if they are not valid.
 
         Parameters:
         pair: The two numbers separated by a dash. (str)
@@ -258,13 +285,17 @@ class Roulette(game.Game):
         if len(pair) != 2:
             self.human.error('You must enter two numbers for a {} bet.'.format(bet_type))
         # Check that they are on the wheel.
-        elif pair[0] not in self.numbers:
+        elif pair[0] not in self.numbers_set:
             self.human.error('{} is not in this layout.'.format(pair[0]))
-        elif pair[1] not in self.numbers:
+        elif pair[1] not in self.numbers_set:
             self.human.error('{} is not in this layout.'.format(pair[1]))
         else:
-            return True
-        return False
+            # Return the numbers in order.
+            low, high = int(pair[0]), int(pair[1])
+            if low > high:
+                low, high = high, low
+            return low, high
+        return ()
 
     def complete_corners(self, bets, number, wager):
         """
@@ -275,22 +306,23 @@ class Roulette(game.Game):
         number: The number bet on. (int)
         wager: The ammount bet. (int)
         """
-        # Add the up left corner bet.
         text = 'corner bet on {}-{}'
-        if number > 3 and number % 3 != 1:
-            targets = [str(n) for n in (number - 4, number - 3, number - 1, number)]
+        column = number % 3
+        # Add the up left corner bet.
+        if number > 3 and column != 1:
+            targets = tuple(str(n) for n in (number - 4, number - 3, number - 1, number))
             bets.append((text.format(number - 4, number), targets, wager))
         # Add the up right corner bet.
-        if number > 3 and number % 3:
-            targets = [str(n) for n in (number - 3, number - 2, number, number + 1)]
+        if number > 3 and column:
+            targets = tuple(str(n) for n in (number - 3, number - 2, number, number + 1))
             bets.append((text.format(number - 3, number + 1), targets, wager))
         # Add the down right corner bet.
-        if number < 34 and number % 3:
-            targets = [str(n) for n in (number, number + 1, number + 3, number + 4)]
+        if number < 34 and column:
+            targets = tuple(str(n) for n in (number, number + 1, number + 3, number + 4))
             bets.append((text.format(number, number + 4), targets, wager))
         # Add the down left corner bet.
-        if number < 34 and number % 3 != 1:
-            targets = [str(n) for n in (number - 1, number, number + 2, number + 3)]
+        if number < 34 and column != 1:
+            targets = tuple(str(n) for n in (number - 1, number, number + 2, number + 3))
             bets.append((text.format(number - 1, number + 3), targets, wager))
         return bets
 
@@ -305,36 +337,37 @@ class Roulette(game.Game):
         """
         text = 'split bet on {}-{}'
         number_text = str(number)
+        column = number % 3
         # Add the up split bet.
         if number > 3:
-            bets.append((text.format(number, number - 3), [number_text, str(number - 3)], wager))
+            bets.append((text.format(number, number - 3), (number_text, str(number - 3)), wager))
         elif self.layout == 'french':
             if number:
-                bets.append(('split bet on 0-{}'.format(number), ['0', number_text], wager))
+                bets.append(('split bet on 0-{}'.format(number), ('0', number_text), wager))
         elif number:
             if number != 1:
-                bets.append(('split bet on 00-{}'.format(number), ['00', number_text], wager))
+                bets.append(('split bet on 00-{}'.format(number), ('00', number_text), wager))
             if number != 3:
-                bets.append(('split bet on 0-{}'.format(number), ['0', number_text], wager))
+                bets.append(('split bet on 0-{}'.format(number), ('0', number_text), wager))
         # Add the down split bet.
         if number < 34:
             if number:
-                bets.append((text.format(number, number + 3), [number_text, str(number + 3)], wager))
+                bets.append((text.format(number, number + 3), (number_text, str(number + 3)), wager))
             elif self.layout == 'french':
                 for down in range(1, 3):
-                    bets.append(('split bet on 0-{}'.format(number), ['0', number_text], wager))
+                    bets.append(('split bet on 0-{}'.format(number), ('0', number_text), wager))
             elif number_text == '0':
-                bets.append(('split bet on 0-1', ['0', '1'], wager))
-                bets.append(('split bet on 0-2', ['0', '2'], wager))
+                bets.append(('split bet on 0-1', ('0', '1'), wager))
+                bets.append(('split bet on 0-2', ('0', '2'), wager))
             elif number_text == '00':
-                bets.append(('split bet on 00-2', ['00', '2'], wager))
-                bets.append(('split bet on 00-3', ['00', '3'], wager))
+                bets.append(('split bet on 00-2', ('00', '2'), wager))
+                bets.append(('split bet on 00-3', ('00', '3'), wager))
         # Add the right split bet.
-        if number % 3:
-            bets.append((text.format(number, number + 1), [number_text, str(number + 1)], wager))
+        if column:
+            bets.append((text.format(number, number + 1), (number_text, str(number + 1)), wager))
         # Add the left split bet.
-        if number % 3 != 1:
-            bets.append((text.format(number - 1, number), [number_text, str(number - 1)], wager))
+        if column != 1:
+            bets.append((text.format(number - 1, number), (number_text, str(number - 1)), wager))
         return bets
 
     def complete_streets(self, bets, number, wager):
@@ -346,22 +379,19 @@ class Roulette(game.Game):
         number: The number bet on. (int)
         wager: The ammount bet. (int)
         """
-        # Add the street bet.
-        if number % 3:
-            end = number + 3 - (number % 3)
-        else:
-            end = number
+        # Add the street bet, ending at the multiple of three in the number's row.
+        end = (number + 2) // 3 * 3
         if number:
-            targets = [str(n) for n in range(end - 2, end + 1)]
+            targets = tuple(str(n) for n in range(end - 2, end + 1))
             bets.append(('street bet on {}-{}-{}'.format(*targets), targets, wager))
         text = 'double street bet on {}-{}'
         # Add the up double street bet.
         if number > 3:
-            targets = [str(n) for n in range(end - 5, end + 1)]
+            targets = tuple(str(n) for n in range(end - 5, end + 1))
             bets.append((text.format(end - 5, end), targets, wager))
         # Add the down double street bet.
         if number < 34:
-            targets = [str(n) for n in range(end - 2, end + 4)]
+            targets = tuple(str(n) for n in range(end - 2, end + 4))
             bets.append((text.format(end - 2, end + 3), targets, wager))
         return bets
 
@@ -373,14 +403,14 @@ class Roulette(game.Game):
         number: The number bet on. (int)
         wager: The ammount bet. (int)
         """
-        sub_bets = [('trio bet on 0-1-2', ['0', '1', '2'], wager)]
+        sub_bets = [('trio bet on 0-1-2', ('0', '1', '2'), wager)]
         if self.layout == 'french':
-            sub_bets.append(('trio bet on 0-2-3', ['0', '2', '3'], wager))
-            sub_bets.append(('basket bet', ['0', '1', '2', '3'], wager))
+            sub_bets.append(('trio bet on 0-2-3', ('0', '2', '3'), wager))
+            sub_bets.append(('basket bet', ('0', '1', '2', '3'), wager))
         if self.layout == 'american':
-            sub_bets.append(('trio bet on 00-2-3', ['00', '2', '3'], wager))
-            sub_bets.append(('trio bet on 0-00-2', ['0', '00', '2'], wager))
-            sub_bets.append(('top line bet', ['0', '00', '1', '2', '3'], wager))
+            sub_bets.append(('trio bet on 00-2-3', ('00', '2', '3'), wager))
+            sub_bets.append(('trio bet on 0-00-2', ('0', '00', '2'), wager))
+            sub_bets.append(('top line bet', ('0', '00', '1', '2', '3'), wager))
         return [bet for bet in sub_bets if str(number) in bet[1]]
 
     def do_basket(self, arguments):
@@ -393,7 +423,7 @@ class Roulette(game.Game):
         """
         # Handle aliases.
         words = arguments.split()
-        if words[0].lower() != 'four':
+        if not words or words[0].lower() != 'four':
             words = ['basket'] + words
         # Check the bet.
         numbers, bet = self.check_bet(' '.join(words))
@@ -409,10 +439,10 @@ class Roulette(game.Game):
         """
         Show a numbered list of the current bets.
         """
-        text = '\n'
-        for bet_index, bet in enumerate(self.bets):
-            text += '{}: {} ({} bucks)\n'.format(bet_index + 1, bet[0], bet[2])
-        self.human.tell(text[:-1])
+        lines = ['']
+        for bet_index, bet in enumerate(self.bets, start = 1):
+            lines.append('{}: {} ({} bucks)'.format(bet_index, bet[0], bet[2]))
+        self.human.tell('\n'.join(lines))
         return True
 
     def do_black(self, arguments):
@@ -450,20 +480,11 @@ class Roulette(game.Game):
         # Check the bet
         column, bet = self.check_bet(arguments)
         if column:
-            # Get the numbers for the column
-            targets = []
-            # Check for first column.
-            if column.lower() in ('1', 'p', 'f'):
-                targets = [str(number) for number in range(1, 37, 3)]
-            # Check for second column.
-            elif column.lower() in ('2', 'm', 's'):
-                targets = [str(number) for number in range(2, 37, 3)]
-            # Check for third column.
-            elif column.lower() in ('3', 'd', 't'):
-                targets = [str(number) for number in range(3, 37, 3)]
-            if targets:
+            # Check for a valid column.
+            if column.lower() in self.group_index:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
+                targets = self.columns[self.group_index[column.lower()]]
                 self.bets.append(('column bet on {}'.format(column), targets, bet))
             else:
                 # Warn on invalid column
@@ -491,23 +512,26 @@ class Roulette(game.Game):
         # Check the wager
         number_text, wager = self.check_bet(' '.join(words))
         if number_text:
-            if number_text in self.numbers:
-                number = int(number_text)
-                # Add the single wager.
-                bets = [('single bet on {}'.format(number), [number_text], wager)]
-                # Add the multi-number bets bets.
-                bets = self.complete_splits(bets, number, wager)
-                bets = self.complete_streets(bets, number, wager)
-                bets.extend(self.complete_zero(number, wager))
-                bets = self.complete_corners(bets, number, wager)
-                # Convert to progressive betting if required.
+            if number_text in self.numbers_set:
+                # Get the bets for the number, building them the first time.
+                if number_text not in self.complete_bets:
+                    number = int(number_text)
+                    # Add the single bet.
+                    bets = [('single bet on {}'.format(number), (number_text,), 1)]
+                    # Add the multi-number bets bets.
+                    bets = self.complete_splits(bets, number, 1)
+                    bets = self.complete_streets(bets, number, 1)
+                    bets.extend(self.complete_zero(number, 1))
+                    bets = self.complete_corners(bets, number, 1)
+                    self.complete_bets[number_text] = bets
+                unit_bets = self.complete_bets[number_text]
+                # Apply the wager, converting to progressive betting if required.
                 if progressive:
-                    prog_bets = []
-                    for text, targets, wager in bets:
-                        prog_bets.append((text, targets, wager * len(targets)))
-                    bets = prog_bets
+                    bets = [(text, targets, wager * len(targets)) for text, targets, unit in unit_bets]
+                else:
+                    bets = [(text, targets, wager) for text, targets, unit in unit_bets]
                 # Check wager against what player has.
-                total_bet = sum([wager for text, targets, wager in bets])
+                total_bet = sum(bet for text, targets, bet in bets)
                 if total_bet > self.scores[self.human.name]:
                     self.human.error('You do not have enough bucks for the total wager.')
                 else:
@@ -533,13 +557,14 @@ class Roulette(game.Game):
         # Check the bet.
         numbers, bet = self.check_bet(arguments)
         # Check for two numbers.
-        if numbers and self.check_two_numbers(numbers, 'corner'):
+        pair = numbers and self.check_two_numbers(numbers, 'corner')
+        if pair:
             # Check for a valid corner.
-            low, high = sorted([int(corner) for corner in numbers.split('-')])
+            low, high = pair
             if high - low == 4 and low % 3:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
-                targets = [str(number) for number in (low, low + 1, high - 1, high)]
+                targets = tuple(str(number) for number in (low, low + 1, high - 1, high))
                 self.bets.append(('corner bet on {}'.format(numbers), targets, bet))
             else:
                 message = '{} and {} are not the low and high of a square of numbers.'
@@ -559,18 +584,19 @@ class Roulette(game.Game):
         """
         # Handle extra words and aliases.
         words = arguments.lower().split()
-        if words[0] in ('street', 'line'):
+        if words and words[0] in ('street', 'line'):
             arguments = ' '.join(words[1:])
         # Check the bet.
         numbers, bet = self.check_bet(arguments)
         # Check for two numbers.
-        if numbers and self.check_two_numbers(numbers, 'double street'):
+        pair = numbers and self.check_two_numbers(numbers, 'double street')
+        if pair:
             # Check for valid double street.
-            low, high = sorted([int(x) for x in numbers.split('-')])
+            low, high = pair
             if high - low == 5 and not high % 3:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
-                targets = [str(number) for number in range(low, high + 1)]
+                targets = tuple(str(number) for number in range(low, high + 1))
                 self.bets.append(('double street bet on {}'.format(numbers), targets, bet))
         return True
 
@@ -592,17 +618,11 @@ class Roulette(game.Game):
         # Check the bet.
         dozen, bet = self.check_bet(arguments)
         if dozen:
-            # Get the numbers in the dozen.
-            targets = []
-            if dozen.lower() in ('1', 'p', 'f'):
-                targets = [str(number) for number in range(1, 13)]
-            elif dozen.lower() in ('2', 'm', 's'):
-                targets = [str(number) for number in range(12, 25)]
-            elif dozen.lower() in ('3', 'd', 't'):
-                targets = [str(number) for number in range(24, 37)]
-            if targets:
+            # Check for a valid dozen.
+            if dozen.lower() in self.group_index:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
+                targets = self.dozens[self.group_index[dozen.lower()]]
                 self.bets.append(('dozen bet on {}'.format(dozen), targets, bet))
             else:
                 # Warn the user if the dozen is invalid.
@@ -623,7 +643,7 @@ class Roulette(game.Game):
         if numbers:
             # Make the bet.
             self.scores[self.human.name] -= bet
-            self.bets.append(('even bet', [str(number) for number in range(2, 37, 2)], bet))
+            self.bets.append(('even bet', self.even_numbers, bet))
         return True
 
     def do_final(self, arguments):
@@ -641,9 +661,9 @@ class Roulette(game.Game):
         digit, bet = self.check_bet(arguments)
         if digit:
             # Check the digit.
-            if digit in '1234567890':
+            if digit in self.finals:
                 # Get the numbers to bet on.
-                numbers = [number for number in self.numbers if number[-1] == digit and number not in '00']
+                numbers = self.finals[digit]
                 # Check the full bet.
                 full_bet = bet * len(numbers)
                 if full_bet > self.scores[self.human.name]:
@@ -652,7 +672,7 @@ class Roulette(game.Game):
                 else:
                     # Make the bets.
                     for number in numbers:
-                        self.bets.append(('single bet on {}'.format(number), [number], bet))
+                        self.bets.append(('single bet on {}'.format(number), (number,), bet))
                     self.scores[self.human.name] -= full_bet
             else:
                 self.human.error('That is not a valid final digit.')
@@ -677,9 +697,9 @@ class Roulette(game.Game):
                     except ValueError:
                         self.human.error('Please enter two numbers separated by a dash')
                     if low > 0 and high - low == 4:
-                        targets = [str(n) for n in (low, low + 1, high - 1, high)]
+                        targets = tuple(str(n) for n in (low, low + 1, high - 1, high))
                         # Make one of the four win.
-                        self.forced_spin = targets[:]
+                        self.forced_spin = list(targets)
                         # Set the bet to 1:1
                         targets = targets * 4 + targets[:2]
                         self.bets.append(('Corner bet on {}-{}.'.format(low, high), targets, 1))
@@ -690,7 +710,7 @@ class Roulette(game.Game):
         # A Blackjack win makes the next number black.
         elif game == 'blackjack':
             if not losses:
-                self.forced_spin = self.black[:]
+                self.forced_spin = list(self.black)
                 self.human.tell('\nThe next spin will be black.')
         # A Klondike win makes the next number a multiple of seven.
         elif game == 'klondike':
@@ -715,7 +735,7 @@ class Roulette(game.Game):
         if numbers:
             # Make the bet.
             self.scores[self.human.name] -= bet
-            self.bets.append(('high bet', [str(number) for number in range(19, 37)], bet))
+            self.bets.append(('high bet', self.high_numbers, bet))
         return True
 
     def do_layout(self, arguments):
@@ -724,19 +744,21 @@ class Roulette(game.Game):
         """
         # Get the correct zeroes.
         if self.layout == 'american':
-            text = '\n  0  |  00  \n'
+            lines = ['', '  0  |  00  ']
         else:
-            text = '\n      0     \n'
-        # Display the number is columns.
-        for number in range(1, 37):
-            # Use parens to signify black numbers.
-            if str(number) in self.red:
-                text += ' {:2} '.format(number)
-            else:
-                text += '({:2})'.format(number)
-            if not number % 3:
-                text += '\n'
-        self.human.tell(text + '\nred (black)')
+            lines = ['', '      0     ']
+        # Display the numbers in rows of three.
+        for row_start in range(1, 37, 3):
+            row = []
+            for number in range(row_start, row_start + 3):
+                # Use parens to signify black numbers.
+                if str(number) in self.red:
+                    row.append(' {:2} '.format(number))
+                else:
+                    row.append('({:2})'.format(number))
+            lines.append(''.join(row))
+        lines.append('\nred (black)')
+        self.human.tell('\n'.join(lines))
         return True
 
     def do_low(self, arguments):
@@ -752,7 +774,7 @@ class Roulette(game.Game):
         if numbers:
             # Make the bet.
             self.scores[self.human.name] -= bet
-            self.bets.append(('low bet', [str(number) for number in range(1, 19)], bet))
+            self.bets.append(('low bet', self.low_numbers, bet))
         return True
 
     def do_neighbors(self, arguments):
@@ -794,13 +816,13 @@ class Roulette(game.Game):
                 self.human.error('You do not have enough money for the full bet.')
             elif numbers:
                 # Make the bet.
-                self.bets.append(('trio bet on 0-2-3', ['0', '2', '3'], bet * 2))
-                self.bets.append(('split bet on 4-7', ['4', '7'], bet))
-                self.bets.append(('split bet on 12-15', ['12', '15'], bet))
-                self.bets.append(('split bet on 18-21', ['18', '21'], bet))
-                self.bets.append(('split bet on 19-22', ['19', '22'], bet))
-                self.bets.append(('corner bet on 25-29', ['25', '26', '28', '29'], bet * 2))
-                self.bets.append(('split bet on 32-35', ['32', '35'], bet))
+                self.bets.append(('trio bet on 0-2-3', ('0', '2', '3'), bet * 2))
+                self.bets.append(('split bet on 4-7', ('4', '7'), bet))
+                self.bets.append(('split bet on 12-15', ('12', '15'), bet))
+                self.bets.append(('split bet on 18-21', ('18', '21'), bet))
+                self.bets.append(('split bet on 19-22', ('19', '22'), bet))
+                self.bets.append(('corner bet on 25-29', ('25', '26', '28', '29'), bet * 2))
+                self.bets.append(('split bet on 32-35', ('32', '35'), bet))
                 self.scores[self.human.name] -= 9 * bet
         # Warn the user if there is invalid input.
         elif int_args:
@@ -840,7 +862,7 @@ class Roulette(game.Game):
         if numbers:
             # Make the bet.
             self.scores[self.human.name] -= bet
-            self.bets.append(('odd bet', [str(number) for number in range(1, 37, 2)], bet))
+            self.bets.append(('odd bet', self.odd_numbers, bet))
         return True
 
     def do_orphans(self, argument):
@@ -862,11 +884,11 @@ class Roulette(game.Game):
             self.human.error('You can only make that bet on the French layout.')
         elif numbers:
             # Make the bet.
-            self.bets.append(('single bet on 1', ['1'], bet))
-            self.bets.append(('split bet on 6-9', ['6', '9'], bet))
-            self.bets.append(('split bet on 14-17', ['14', '17'], bet))
-            self.bets.append(('split bet on 17-20', ['17', '20'], bet))
-            self.bets.append(('split bet on 31-34', ['31', '34'], bet))
+            self.bets.append(('single bet on 1', ('1',), bet))
+            self.bets.append(('split bet on 6-9', ('6', '9'), bet))
+            self.bets.append(('split bet on 14-17', ('14', '17'), bet))
+            self.bets.append(('split bet on 17-20', ('17', '20'), bet))
+            self.bets.append(('split bet on 31-34', ('31', '34'), bet))
             self.scores[self.human.name] -= 5 * bet
         return True
 
@@ -897,10 +919,10 @@ class Roulette(game.Game):
         elif numbers:
             # Make the bet.
             if bet_mod == 10:
-                self.bets.append(('split bet on 2-3', ['2', '3'], bet))
+                self.bets.append(('split bet on 2-3', ('2', '3'), bet))
                 primes = primes[2:]
             for prime in primes:
-                self.bets.append(('single bet on {}'.format(prime), [prime], bet))
+                self.bets.append(('single bet on {}'.format(prime), (prime,), bet))
             self.scores[self.human.name] -= bet_mod * bet
         return True
 
@@ -914,18 +936,19 @@ class Roulette(game.Game):
         """
         # Determine overall winnings or losses.
         self.scores[self.human.name] -= self.stake
+        winnings = self.scores[self.human.name]
         # Determine if the game is a win or a loss.
         result = 'won'
-        if self.scores[self.human.name] > 0:
+        if winnings > 0:
             self.win_loss_draw[0] = 1
-        elif self.scores[self.human.name] < 0:
+        elif winnings < 0:
             result = 'lost'
             self.win_loss_draw[1] = 1
         else:
             self.win_loss_draw[2] = 1
         # Inform the user.
-        plural = utility.plural(abs(self.scores[self.human.name]), 'buck')
-        self.human.tell('\nYou {} {} {}.'.format(result, abs(self.scores[self.human.name]), plural))
+        plural = utility.plural(abs(winnings), 'buck')
+        self.human.tell('\nYou {} {} {}.'.format(result, abs(winnings), plural))
         # Quit the game.
         self.flags |= 4
         self.force_end = True
@@ -961,11 +984,11 @@ class Roulette(game.Game):
         if arguments.strip().isdigit():
             bet_index = int(arguments) - 1
             # Check for a valid number
-            if bet_index < len(self.bets):
+            if 0 <= bet_index < len(self.bets):
                 # Remove the bet
-                self.scores[self.human.name] += self.bets[bet_index][2]
-                self.human.tell('The {} was removed.'.format(self.bets[bet_index][0]))
-                self.bets.remove(self.bets[bet_index])
+                text, targets, bet = self.bets.pop(bet_index)
+                self.scores[self.human.name] += bet
+                self.human.tell('The {} was removed.'.format(text))
             # Warn the user about invalid input.
             else:
                 self.human.error('There are not that many bets.')
@@ -1004,8 +1027,7 @@ class Roulette(game.Game):
         if numbers:
             # Make the bet.
             self.scores[self.human.name] -= bet
-            targets = ['1', '5', '9', '12', '14', '16', '19', '23', '27', '30', '32', '34']
-            self.bets.append(('snake bet', targets, bet))
+            self.bets.append(('snake bet', self.snake_numbers, bet))
         return True
 
     def do_spin(self, arguments):
@@ -1019,9 +1041,11 @@ class Roulette(game.Game):
         self.human.tell()
         for spin in range(random.randint(3, 5)):
             self.human.tell('Spinning...')
-            time.sleep(1)
+            if not self.fast:
+                time.sleep(1)
         self.human.tell('Clickety clackity...')
-        time.sleep(1)
+        if not self.fast:
+            time.sleep(1)
         # Get the winning number.
         if self.forced_spin:
             winner = random.choice(self.forced_spin)
@@ -1050,18 +1074,14 @@ class Roulette(game.Game):
         numbers, bet = self.check_bet(arguments)
         if numbers and self.check_two_numbers(numbers, 'split'):
             # Check for a valid split.
-            low, high = sorted([int(x) for x in numbers.split('-')])
-            valid = (low and high and abs(high - low) == 1 and min(low, high) % 3)
-            valid = valid or (low and high and abs(high - low) == 3)
-            valid = valid or (self.layout == 'american' and numbers in ('0-1', '0-2', '00-2', '00-3'))
-            valid = valid or (self.layout == 'french' and numbers in ('0-1', '0-2', '0-3'))
-            if valid:
+            pair = tuple(numbers.split('-'))
+            if frozenset(pair) in self.splits:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
-                self.bets.append(('split bet on {}'.format(numbers), numbers.split('-'), bet))
+                self.bets.append(('split bet on {}'.format(numbers), pair, bet))
             else:
                 # Warn the user about invalid input.
-                self.human.error('{} and {} are not adjacent on the layout.'.format(low, high))
+                self.human.error('{} and {} are not adjacent on the layout.'.format(*pair))
         return True
 
     def do_straight(self, arguments):
@@ -1074,13 +1094,13 @@ class Roulette(game.Game):
         # Check the bet.
         number, bet = self.check_bet(arguments)
         if number:
-            if number not in self.numbers:
+            if number not in self.numbers_set:
                 # Warn the user about invalid input.
                 self.human.error('That number is not in this layout.')
             else:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
-                self.bets.append(('straight bet on {}'.format(number), [number], bet))
+                self.bets.append(('straight bet on {}'.format(number), (number,), bet))
         return True
 
     def do_street(self, arguments):
@@ -1103,9 +1123,9 @@ class Roulette(game.Game):
                 self.human.error('A valid street must end in a multiple of three.')
             else:
                 # Make the bet.
-                text = '{}-{}-{}'.format(end - 2, end - 1, end)
+                targets = tuple(str(number) for number in range(end - 2, end + 1))
                 self.scores[self.human.name] -= bet
-                self.bets.append(('street bet on {}'.format(text), text.split('-'), bet))
+                self.bets.append(('street bet on {}'.format('-'.join(targets)), targets, bet))
         return True
 
     def do_third(self, arguments):
@@ -1136,23 +1156,23 @@ class Roulette(game.Game):
                 self.human.error('You do not have enough money for the full bet.')
             elif numbers:
                 # Make the bet.
-                self.bets.append(('split bet on 5-8', ['5', '8'], bet))
-                self.bets.append(('split bet on 10-11', ['10', '11'], bet))
-                self.bets.append(('split bet on 13-16', ['13', '16'], bet))
-                self.bets.append(('split bet on 23-24', ['23', '24'], bet))
-                self.bets.append(('split bet on 27-30', ['27', '30'], bet))
-                self.bets.append(('split bet on 33-36', ['33', '36'], bet))
+                self.bets.append(('split bet on 5-8', ('5', '8'), bet))
+                self.bets.append(('split bet on 10-11', ('10', '11'), bet))
+                self.bets.append(('split bet on 13-16', ('13', '16'), bet))
+                self.bets.append(('split bet on 23-24', ('23', '24'), bet))
+                self.bets.append(('split bet on 27-30', ('27', '30'), bet))
+                self.bets.append(('split bet on 33-36', ('33', '36'), bet))
                 # Add any special bets.
                 if '5-8-10-11' in arguments:
-                    self.bets.append(('single bet on 5', ['5'], bet))
-                    self.bets.append(('single bet on 8', ['8'], bet))
-                    self.bets.append(('single bet on 10', ['10'], bet))
-                    self.bets.append(('single bet on 11', ['11'], bet))
+                    self.bets.append(('single bet on 5', ('5',), bet))
+                    self.bets.append(('single bet on 8', ('8',), bet))
+                    self.bets.append(('single bet on 10', ('10',), bet))
+                    self.bets.append(('single bet on 11', ('11',), bet))
                 elif 'ferrari' in arguments.lower():
-                    self.bets.append(('single bet on 8', ['8'], bet))
-                    self.bets.append(('single bet on 11', ['11'], bet))
-                    self.bets.append(('single bet on 23', ['23'], bet))
-                    self.bets.append(('single bet on 30', ['30'], bet))
+                    self.bets.append(('single bet on 8', ('8',), bet))
+                    self.bets.append(('single bet on 11', ('11',), bet))
+                    self.bets.append(('single bet on 23', ('23',), bet))
+                    self.bets.append(('single bet on 30', ('30',), bet))
                 self.scores[self.human.name] -= full_bet
         elif self.layout != 'french':
             self.human.error('You can only make that be on the French layout.')
@@ -1170,7 +1190,7 @@ class Roulette(game.Game):
         """
         # Handle extra words/aliases.
         words = arguments.split()
-        if words[0].lower() != 'line':
+        if not words or words[0].lower() != 'line':
             words = ['line'] + words
         # Check the bet and the layout.
         numbers, bet = self.check_bet(' '.join(words))
@@ -1197,14 +1217,10 @@ class Roulette(game.Game):
         numbers, bet = self.check_bet(arguments)
         if numbers:
             # Check the numbers based on the layout.
-            if self.layout == 'american':
-                valid = numbers in ('0-1-2', '0-00-2', '00-2-3')
-            else:
-                valid = numbers in ('0-1-2', '0-2-3')
-            if valid:
+            if numbers in self.trios:
                 # Make the bet.
                 self.scores[self.human.name] -= bet
-                self.bets.append(('trio bet on {}'.format(numbers), numbers.split('-'), bet))
+                self.bets.append(('trio bet on {}'.format(numbers), tuple(numbers.split('-')), bet))
             else:
                 # Warn the user about invalid input.
                 self.human.error('That is not a valid trio on this layout.')
@@ -1236,12 +1252,12 @@ class Roulette(game.Game):
                 self.human.error('You do not have enough money for the full bet.')
             elif numbers:
                 # Make the bet.
-                self.bets.append(('split bet on 0-3', ['0', '3'], bet))
-                self.bets.append(('split bet on 12-15', ['12', '15'], bet))
-                self.bets.append(('single bet on 26', ['26'], bet))
-                self.bets.append(('split bet on 32-35', ['32', '35'], bet))
+                self.bets.append(('split bet on 0-3', ('0', '3'), bet))
+                self.bets.append(('split bet on 12-15', ('12', '15'), bet))
+                self.bets.append(('single bet on 26', ('26',), bet))
+                self.bets.append(('split bet on 32-35', ('32', '35'), bet))
                 if 'naca' in arguments.lower():
-                    self.bets.append(('single bet on 19', ['19'], bet))
+                    self.bets.append(('single bet on 19', ('19',), bet))
                 self.scores[self.human.name] -= full_bet
         # Warn the user about invalid input.
         elif int_args:
@@ -1269,6 +1285,28 @@ class Roulette(game.Game):
         self.numbers = [str(number) for number in range(37)]
         if self.layout == 'american':
             self.numbers.append('00')
+        self.numbers_set = frozenset(self.numbers)
+        # Set the numbers for final bets.
+        self.finals = {digit: [] for digit in '0123456789'}
+        for number in self.numbers[1:37]:
+            self.finals[number[-1]].append(number)
+        # Set the adjacent numbers for split bets.
+        self.splits = set()
+        for number in range(1, 37):
+            if number % 3:
+                self.splits.add(frozenset((str(number), str(number + 1))))
+            if number < 34:
+                self.splits.add(frozenset((str(number), str(number + 3))))
+        if self.layout == 'american':
+            zero_splits = (('0', '1'), ('0', '2'), ('00', '2'), ('00', '3'))
+        else:
+            zero_splits = (('0', '1'), ('0', '2'), ('0', '3'))
+        self.splits.update(frozenset(pair) for pair in zero_splits)
+        # Set the numbers for trio bets.
+        if self.layout == 'american':
+            self.trios = frozenset(('0-1-2', '0-00-2', '00-2-3'))
+        else:
+            self.trios = frozenset(('0-1-2', '0-2-3'))
 
     def neighborhood(self, number, width, bet):
         """
@@ -1283,18 +1321,21 @@ class Roulette(game.Game):
         if bet * width > self.scores[self.human.name]:
             self.human.error('You do not have enough money for the full bet.')
         elif number:
-            if number in self.numbers:
-                # Get the right wheel.
-                if self.layout == 'french':
-                    wheel = self.french
-                else:
-                    wheel = self.american
-                # Find the number.
-                location = wheel.index(number)
+            if number in self.numbers_set:
+                # Find the neighborhood on the wheel the first time it is bet on.
+                if (number, width) not in self.neighborhoods:
+                    # Get the right wheel.
+                    if self.layout == 'french':
+                        wheel = self.french
+                    else:
+                        wheel = self.american
+                    # Find the number.
+                    location = wheel.index(number)
+                    indexes = range(location - width // 2, location + width // 2 + 1)
+                    self.neighborhoods[number, width] = tuple(wheel[index % len(wheel)] for index in indexes)
                 # Make the bets.
-                for index in range(location - width // 2, location + width // 2 + 1):
-                    slot = wheel[index % len(wheel)]
-                    self.bets.append(('single on {}'.format(slot), [slot], bet))
+                for slot in self.neighborhoods[number, width]:
+                    self.bets.append(('single on {}'.format(slot), (slot,), bet))
                 self.scores[self.human.name] -= width * bet
 
     def pay_out(self, winner):
@@ -1306,26 +1347,29 @@ class Roulette(game.Game):
         """
         # Check each bet.
         total_winnings = 0
+        refunds = 0
+        lines = []
         for text, target, bet in self.bets:
             # Handle winners
             if winner in target:
-                self.human.tell('Your {} won!'.format(text))
                 winnings = bet * (36 // len(target))
-                self.human.tell('You won {} bucks!'.format(winnings))
-                self.scores[self.human.name] += winnings
+                lines.append('Your {} won!'.format(text))
+                lines.append('You won {} bucks!'.format(winnings))
                 total_winnings += winnings
             # Handle losers
             else:
-                self.human.tell('Your {} lost.'.format(text, target))
+                lines.append('Your {} lost.'.format(text))
                 if self.uk_rule and len(target) == 18:
-                    self.scores[self.human.name] += bet // 2
-        # Reset bets.
+                    refunds += bet // 2
+        # Pay the player and reset the bets.
+        self.scores[self.human.name] += total_winnings + refunds
         self.bets = []
-        # Inform the user of total winnings.
+        # Inform the user of the results and total winnings.
         if total_winnings:
-            self.human.tell('Your total winnings this spin were {} bucks.'.format(total_winnings))
+            lines.append('Your total winnings this spin were {} bucks.'.format(total_winnings))
         else:
-            self.human.tell('You did not win anything this spin.')
+            lines.append('You did not win anything this spin.')
+        self.human.tell('\n'.join(lines))
 
     def player_action(self, player):
         """
@@ -1353,9 +1397,13 @@ class Roulette(game.Game):
         # Set the payout options.
         self.option_set.add_option('uk-rule', ['uk'],
             question = 'Should the UK rule (1/2 back on lost 1:1 bets) be in effect? bool')
+        # Set the display options.
+        self.option_set.add_option('fast', ['fs'], question = 'Should the wheel spin without pausing? bool')
 
     def set_up(self):
         """Set up the game. (None)"""
         self.scores = {self.human.name: self.stake}
         self.bets = []
+        self.complete_bets = {}
         self.forced_spin = []
+        self.neighborhoods = {}
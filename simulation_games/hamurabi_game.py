@@ -11,6 +11,7 @@ CREDITS: The credits for Hamurabi. (str)
 IMMIGRATION_HELP: Help text for factors driving immigration. (str)
 RULES: The basic rules of Hamurabi. (str)
 WINNING_HELP: Help text for how winning is calculated. (str)
+YEAR_INTRO: The game status shown at the start of each turn. (str)
 
 Classes:
 Hamurabi: A game of Humurabi. (game.Game)
@@ -67,6 +68,11 @@ land per person at the end of the game, you get a two point win. Otherwise,
 you get a three point win.
 """
 
+YEAR_INTRO = """
+Hamurabi, I beg to report to you, in year {}, {} people starved and {} came to the city.
+You havested {} bushels per acre.
+Rats ate {} bushels."""
+
 
 class Hamurabi(game.Game):
     """
@@ -109,6 +115,7 @@ class Hamurabi(game.Game):
     do_plant: Seed the land for the next harvest. (bool)
     do_sell: Sell land for grain. (bool)
     show_status: Show the current game status. (None)
+    year_report: Report on the results of the last year. (str)
 
     Overridden Methods:
     game_over
@@ -126,8 +133,7 @@ class Hamurabi(game.Game):
     name = 'Hamurabi'
     num_options = 4
     rules = RULES
-    year_intro = '\nHamurabi, I beg to report to you, in year {}, {} people starved and {} came to the '
-    year_intro += 'city.\nYou havested {} bushels per acre.\nRats ate {} bushels.'
+    year_intro = YEAR_INTRO
 
     def do_buy(self, arguments):
         """
@@ -145,7 +151,7 @@ class Hamurabi(game.Game):
         # Check for a valid argument
         if acres < 0:
             self.human.error("You can't buy negative acres.")
-        elif acres > self.storage / self.acre_cost:
+        elif acres * self.acre_cost > self.storage:
             self.human.error("You don't have enough grain to buy that many acres.")
         else:
             # Buy the land.
@@ -225,23 +231,21 @@ class Hamurabi(game.Game):
                 self.rats = 0
             else:
                 # Otherwise the rats each some of the storage (1/2 or 1/4).
-                self.rats = int(self.storage / 2 / random.randint(1, 2))
+                self.rats = self.storage // (2 * random.randint(1, 2))
         else:
             self.rats = 0
         self.storage += self.seed * self.bushels_per_acre - self.rats
         # Update population values.
-        self.immigrants = random.randint(1, 5)
-        self.immigrants *= (self.immigration * self.acres + self.storage)
-        self.immigrants = int((self.immigrants / float(self.population) / 100.0) + 1)
-        self.starved = max(0, int(self.population - self.feed // 20.0))
+        attraction = random.randint(1, 5) * (self.immigration * self.acres + self.storage)
+        self.immigrants = attraction // (100 * self.population) + 1
+        self.starved = max(0, self.population - self.feed // 20)
         self.total_starved += self.starved
         self.average_starved += self.total_starved / float(self.population) / self.game_length
         self.population += self.immigrants - self.starved
         # Update real estate values.
         self.acre_cost = random.choice(self.land_costs)
         # Update user.
-        format_params = (self.turns + 1, self.starved, self.immigrants, self.bushels_per_acre, self.rats)
-        self.human.tell(self.year_intro.format(*format_params))
+        self.human.tell(self.year_report())
         # Check for plague.
         if self.turns > 1 and random.random() <= self.plague_chance / 100.0:
             self.human.tell('A horrible plague struck! Half the people died.\n')
@@ -276,7 +280,7 @@ class Hamurabi(game.Game):
         else:
             # Sow your seed upon the dusty earth.
             self.seed += acres
-            self.storage -= int(round(acres / 2.0, 0))
+            self.storage -= (acres + 1) // 2
         return True
 
     def do_sell(self, arguments):
@@ -306,7 +310,7 @@ class Hamurabi(game.Game):
     def game_over(self):
         """Check for the end of the game. (bool)"""
         # check for impeachment
-        if self.starved > self.impeachment * self.population / 100.0:
+        if self.starved * 100 > self.impeachment * self.population:
                 message = 'You starved {} people in one year!!\n'.format(self.starved)
                 message += 'Due to this extreme mismanagement, you have not only been impeached and\n'
                 message += 'thrown out of office, but you have also been declared a national fink!!!!'
@@ -416,15 +420,13 @@ class Hamurabi(game.Game):
         self.grain_mod = 0
         # Display the introduction.
         intro = '\nTry your hand at ruling ancient Sumeria for a {}-year term of office.'
-        self.human.tell(intro.format(self.game_length))
-        format_params = (self.turns + 1, self.starved, self.immigrants, self.bushels_per_acre, self.rats)
-        self.human.tell(self.year_intro.format(*format_params))
+        self.human.tell(intro.format(self.game_length), self.year_report(), sep = '\n')
 
     def show_status(self):
         """Show the current game status. (None)"""
         # Display general stats.
         if self.feed:
-            starving = int(self.population - self.feed // 20.0)
+            starving = self.population - self.feed // 20
         else:
             starving = self.population
         status = '\nThe population is now {} ({} starving).\n'.format(self.population, starving)
@@ -433,3 +435,8 @@ class Hamurabi(game.Game):
         status += 'Land is trading at {} bushels per acre.\n'.format(self.acre_cost)
         # Tell the human.
         self.human.tell(status)
+
+    def year_report(self):
+        """Report on the results of the last year. (str)"""
+        return self.year_intro.format(self.turns + 1, self.starved, self.immigrants, self.bushels_per_acre,
+            self.rats)